@@ -1,14 +1,49 @@
-import os
 import warnings
+import threading
 import ctypes
 import numpy as np
 from ctypes import *
-from typing import Tuple
-from .path import MTHome
+from typing import Dict, List, Tuple
+from .path import MTHome, lib_path, calib_dir, markers_dir
 from .structure import *
 
 MT_MAX_STRING_LENGTH = 400
 
+# Pose pool used by the polling thread: number of slots and initial marker capacity
+MT_POSE_POOL_SIZE = 3
+MT_POSE_POOL_MARKERS = 32
+
+# Polling thread back-off bounds (seconds) while frames keep failing
+MT_POLL_MIN_BACKOFF = 0.01
+MT_POLL_MAX_BACKOFF = 1.0
+
+# Pointer types used in the library prototypes, created once
+_P_LL = POINTER(c_longlong)
+_P_I = POINTER(c_int)
+
+
+def _check_pose_output(arr: np.ndarray, row_shape: Tuple[int, ...], name: str) -> None:
+    """
+    Checks that an output array can be written row by row by the MTC library.
+
+    Parameters:
+        arr (np.ndarray): The output array.
+        row_shape (tuple): The expected shape of each row, (3,) or (3, 3).
+        name (str): The argument name used in the error message.
+
+    Raises:
+        ValueError: If the array is not a NumPy array, or not a writeable, C-contiguous
+            float64 array of shape (M, *row_shape).
+    """
+    if not (isinstance(arr, np.ndarray)
+            and arr.dtype == np.float64
+            and arr.ndim == 1 + len(row_shape) and arr.shape[1:] == row_shape
+            and arr.flags.c_contiguous
+            and arr.flags.writeable):
+        shape = ', '.join(['M'] + [str(d) for d in row_shape])
+        raise ValueError(
+            f"{name} must be a writeable, C-contiguous float64 NumPy array of shape ({shape})")
+
 
 class MTC(object):
     def __init__(self,
@@ -19,21 +54,53 @@ class MTC(object):
 
         Parameters:
             mt_home (str): The path to the MTHome directory.
+
+        Raises:
+            RuntimeError: If the MTC library cannot be located or loaded, or no camera
+                is attached.
         """
-        self.mtc_lib = None
         self.mthome = mt_home
 
+        if mt_home is None:
+            raise RuntimeError("MTHome is not set, could not locate the MTC library")
+
+        # Resolve the directory layout
+        self._lib_path = lib_path(mt_home)
+        self._calib_dir = calib_dir(mt_home)
+        self._markers_dir = markers_dir(mt_home)
+
         # Load the shared library
         try:
-            lib_path = os.path.join(self.mthome, 'Dist64MT4', 'mtc.dll')
-            self.mtc_lib = ctypes.CDLL(lib_path)
+            self.mtc_lib = ctypes.CDLL(self._lib_path)
         except OSError as e:
-            warnings.warn(
-                f"Could not load MTC library from {lib_path}: {e}", RuntimeWarning)
-            return
-
-        # Set types for MTLastErrorString
-        self.mtc_lib.MTLastErrorString.restype = c_char_p
+            raise RuntimeError(
+                f"Could not load MTC library from {self._lib_path}: {e}") from e
+
+        # Set argument and return types of the library functions once
+        self._bind_prototypes()
+
+        # Pre-allocate the camera transform output reused by every pose query
+        self._camera_xf = c_longlong()
+        self._camera_xf_p = pointer(self._camera_xf)
+
+        # Marker names are stable per handle, so they are looked up only once
+        self._name_cache: Dict[int, str] = {}
+        self._name_buf = create_string_buffer(MT_MAX_STRING_LENGTH)
+        self._name_chars = c_int()
+
+        # Reusable pose outputs, grown on demand by _grow_pose_outputs
+        self._pos_out = np.empty((0, 3), dtype=np.float64)
+        self._rot_out = np.empty((0, 3, 3), dtype=np.float64)
+
+        # Background polling state, a ring of pre-allocated pose buffers
+        self._poll_thread = None
+        self._stop_polling = threading.Event()
+        self._pose_pool = [(np.empty((MT_POSE_POOL_MARKERS, 3), dtype=np.float64),
+                            np.empty((MT_POSE_POOL_MARKERS, 3, 3), dtype=np.float64))
+                           for _ in range(MT_POSE_POOL_SIZE)]
+        self._snapshots = [None] * MT_POSE_POOL_SIZE
+        self._latest_idx = -1
+        self._poll_error = None
 
         # Attach available cameras
         self._attach_cameras()
@@ -41,25 +108,24 @@ class MTC(object):
 
         # Count number of cameras
         camera_count = self.get_camera_count()
+        if not camera_count:
+            raise RuntimeError("No camera to connect")
 
-        if camera_count:
-            # Obtain a handle to the camera
-            self._camera = self.get_camera(cam_index)
+        # Obtain a handle to the camera
+        self._camera = self.get_camera(cam_index)
 
-            # Obtain its serial number
-            self.serial_number = self.get_serial_number(self._camera)
+        # Obtain its serial number
+        self.serial_number = self.get_serial_number(self._camera)
 
-            # Set streaming mode
-            self.set_streaming_mode(self.serial_number,
-                                    mtFrameType.Alternating,
-                                    mtDecimation.Dec41,
-                                    mtBitDepth.Bpp14)
+        # Set streaming mode
+        self.set_streaming_mode(self.serial_number,
+                                mtFrameType.Alternating,
+                                mtDecimation.Dec41,
+                                mtBitDepth.Bpp14)
 
-            # Init collection handles
-            self._markers = self._create_collection()
-            self._poseXf = self._create_xform3d()
-        else:
-            warnings.warn("No camera to connect", ResourceWarning)
+        # Init collection handles
+        self._markers = self._create_collection()
+        self._poseXf = self._create_xform3d()
 
     def get_camera_count(self) -> int:
         """
@@ -68,12 +134,7 @@ class MTC(object):
         Returns:
             int: Number of attached cameras.
         """
-        # Set function return type
-        self.mtc_lib.Cameras_Count.restype = c_int
-
-        if self.mtc_lib:
-            return self.mtc_lib.Cameras_Count()
-        return 0
+        return self._Cameras_Count()
 
     def get_camera(self, index: int) -> int:
         """
@@ -85,17 +146,12 @@ class MTC(object):
         Returns:
             int: The camera handle if successful, otherwise None.
         """
-        # Set function argument and return types
-        self.mtc_lib.Cameras_ItemGet.argtypes = [c_int, POINTER(c_longlong)]
-        self.mtc_lib.Cameras_ItemGet.restype = c_int
-
-        if self.mtc_lib:
-            camera_handle = c_longlong()
-            result = self.mtc_lib.Cameras_ItemGet(index, byref(camera_handle))
-            if result == 0:
-                return camera_handle.value
-            else:
-                self._process_error("Cameras_ItemGet")
+        camera_handle = c_longlong()
+        result = self._Cameras_ItemGet(index, byref(camera_handle))
+        if result == 0:
+            return camera_handle.value
+        else:
+            self._process_error("Cameras_ItemGet")
         return None
 
     def get_serial_number(self, camera_handle: int = None) -> int:
@@ -108,23 +164,17 @@ class MTC(object):
         Returns:
             int: The serial number of the camera if successful, otherwise None.
         """
-        # Set function argument and return types
-        self.mtc_lib.Camera_SerialNumberGet.argtypes = [
-            c_longlong, POINTER(c_int)]
-        self.mtc_lib.Camera_SerialNumberGet.restype = c_int
-
         # Set to the default camera
         if camera_handle is None:
             camera_handle = self._camera
 
-        if self.mtc_lib:
-            serial_number = c_int()
-            result = self.mtc_lib.Camera_SerialNumberGet(
-                camera_handle, byref(serial_number))
-            if result == 0:
-                return serial_number.value
-            else:
-                self._process_error("Camera_SerialNumberGet")
+        serial_number = c_int()
+        result = self._Camera_SerialNumberGet(
+            camera_handle, byref(serial_number))
+        if result == 0:
+            return serial_number.value
+        else:
+            self._process_error("Camera_SerialNumberGet")
         return None
 
     def get_camera_resolution(self, camera_handle: int = None) -> Tuple[int, int]:
@@ -138,24 +188,18 @@ class MTC(object):
             tuple: A tuple (width, height) representing the resolution of the camera if successful,
                 otherwise None.
         """
-        # Set function argument and return types
-        self.mtc_lib.Camera_ResolutionGet.argtypes = [
-            c_longlong, POINTER(c_int), POINTER(c_int)]
-        self.mtc_lib.Camera_ResolutionGet.restype = c_int
-
         # Set to the default camera
         if camera_handle is None:
             camera_handle = self._camera
 
-        if self.mtc_lib:
-            width = c_int()
-            height = c_int()
-            result = self.mtc_lib.Camera_ResolutionGet(
-                camera_handle, byref(width), byref(height))
-            if result == 0:
-                return (width.value, height.value)
-            else:
-                self._process_error("Camera_ResolutionGet")
+        width = c_int()
+        height = c_int()
+        result = self._Camera_ResolutionGet(
+            camera_handle, byref(width), byref(height))
+        if result == 0:
+            return (width.value, height.value)
+        else:
+            self._process_error("Camera_ResolutionGet")
         return None
 
     def set_streaming_mode(self,
@@ -177,84 +221,414 @@ class MTC(object):
                                                decimation=decimation.value,
                                                bit_depth=bit_depth.value)
 
-        # Set function argument and return types
-        self.mtc_lib.Cameras_StreamingModeSet.argtypes = [
-            POINTER(mtStreamingModeStruct), c_int]
-        self.mtc_lib.Cameras_StreamingModeSet.restype = c_int
-
         # Call the function to set streaming mode
-        result = self.mtc_lib.Cameras_StreamingModeSet(
+        result = self._Cameras_StreamingModeSet(
             byref(streaming_mode), serial_number)
         if result != 0:
             self._process_error("Cameras_StreamingModeSet")
 
-    def get_poses(self, rot: bool = True) -> dict:
+    def get_poses(self, rot: bool = True, copy: bool = True) -> dict:
         """
         Retrieves the poses (positions and optional rotation matrices) of detected markers.
 
         Parameters:
             rot (bool): Whether to include rotation matrices in the output. Defaults to True.
+            copy (bool): Whether to return arrays owned by the caller. If False, the arrays
+                are views of internal buffers that are overwritten by the next call.
+                Defaults to True.
 
         Returns:
             dict: A dictionary where keys are marker names and values are dictionaries containing:
                 - 'pos': A NumPy array of the marker's position (x, y, z).
                 - 'rot': A NumPy array of the marker's 3x3 rotation matrix, if `rot` is True.
+
+        Raises:
+            RuntimeError: If the background polling thread is running.
         """
-        # Dictionary to hold marker data
-        markers = {}
+        self._check_not_polling()
 
-        # Define the argument and return types for the functions used
-        self.mtc_lib.Collection_Int.argtypes = [c_longlong, c_int]
-        self.mtc_lib.Collection_Int.restype = c_longlong
+        # Get the number of markers identified in the current frame
+        num_markers = self._get_frame_markers()
 
-        self.mtc_lib.Marker_Marker2CameraXfGet.argtypes = [
-            c_longlong, c_longlong, c_longlong, POINTER(c_longlong)]
-        self.mtc_lib.Marker_Marker2CameraXfGet.restype = c_int
+        # Output arrays, one allocation per frame or reused across frames
+        if copy:
+            pos_arr = np.empty((num_markers, 3), dtype=np.float64)
+            rot_arr = np.empty((num_markers, 3, 3), dtype=np.float64) if rot else None
+        else:
+            pos_arr, rot_arr = self._grow_pose_outputs(num_markers)
+            if not rot:
+                rot_arr = None
 
-        self.mtc_lib.Xform3D_ShiftGet.argtypes = [
-            c_longlong, POINTER(c_double * 3)]
-        self.mtc_lib.Xform3D_ShiftGet.restype = c_int
+        # Let the library write the poses straight into the output rows
+        names = self._read_poses(num_markers, pos_arr, rot_arr)
 
-        # Define the argument and return types for rotation matrix if requested
+        # Build the markers dict from row views of the output arrays
         if rot:
-            self.mtc_lib.Xform3D_RotMatGet.argtypes = [
-                c_longlong, POINTER(c_double * 9)]
-            self.mtc_lib.Xform3D_RotMatGet.restype = c_int
+            return {name: {'pos': pos_arr[i], 'rot': rot_arr[i]}
+                    for i, name in enumerate(names)}
+        return {name: {'pos': pos_arr[i]} for i, name in enumerate(names)}
+
+    def get_poses_batch(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Retrieves the poses of detected markers as contiguous arrays.
+
+        The poses are written by the library directly into internal buffers that are
+        reused across calls, so the returned arrays are overwritten by the next call.
+        Copy them if they need to outlive the current frame.
+
+        Returns:
+            tuple: A tuple (names, positions, rotations) where:
+                - names: A list of the N marker names.
+                - positions: A NumPy array of shape (N, 3) with the marker positions.
+                - rotations: A NumPy array of shape (N, 3, 3) with the rotation matrices.
+
+        Raises:
+            RuntimeError: If the background polling thread is running.
+        """
+        self._check_not_polling()
+
+        # Get the number of markers identified in the current frame
+        num_markers = self._get_frame_markers()
+
+        # Reuse the output buffers, growing them only when more markers are seen
+        pos_out, rot_out = self._grow_pose_outputs(num_markers)
+        names = self._read_poses(num_markers, pos_out, rot_out)
+
+        return names, pos_out[:num_markers], rot_out[:num_markers]
+
+    def get_positions_only(self,
+                           pos_out: np.ndarray = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Retrieves only the positions of detected markers, skipping the rotation matrices.
+
+        Parameters:
+            pos_out (np.ndarray): An optional C-contiguous float64 array of shape (M, 3) to
+                write the positions into. If None, an internal buffer reused across calls
+                is used, which is overwritten by the next call.
+
+        Returns:
+            tuple: A tuple (names, positions) where:
+                - names: A list of the N marker names.
+                - positions: A NumPy array of shape (N, 3) with the marker positions.
+
+        Raises:
+            ValueError: If `pos_out` is not a writeable, C-contiguous float64 NumPy array
+                of shape (M, 3), or has fewer rows than the number of detected markers.
+            RuntimeError: If the background polling thread is running.
+        """
+        self._check_not_polling()
+
+        # Reject a bad layout before a frame is grabbed
+        if pos_out is not None:
+            _check_pose_output(pos_out, (3,), 'pos_out')
 
         # Get the number of markers identified in the current frame
         num_markers = self._get_frame_markers()
 
-        # Loop over each marker to retrieve its pose
+        if pos_out is None:
+            pos_out, _ = self._grow_pose_outputs(num_markers)
+        names = self._read_poses(num_markers, pos_out)
+
+        return names, pos_out[:num_markers]
+
+    def start_polling(self, warmup_frames: int = 0) -> None:
+        """
+        Starts a background thread that continually grabs frames and publishes the
+        latest marker poses, to be read with `snapshot`.
+
+        While polling, `get_poses`, `get_poses_batch` and `get_positions_only` raise
+        RuntimeError, since the polling thread owns the marker collection and pose
+        transform handles.
+
+        Parameters:
+            warmup_frames (int): The number of frames to process with `get_poses_batch`
+                before the thread starts, priming the marker name cache, sizing the pose
+                pool for the most markers seen and touching it, so the first snapshots
+                do not pay first-use costs. Defaults to 0.
+        """
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            return
+
+        # Drop the snapshots of any previous polling session, before the warm-up
+        # overwrites the pose pool slots they point into
+        self._latest_idx = -1
+        self._snapshots = [None] * MT_POSE_POOL_SIZE
+        self._poll_error = None
+
+        if warmup_frames > 0:
+            max_markers = 0
+            for _ in range(warmup_frames):
+                names, _, _ = self.get_poses_batch()
+                max_markers = max(max_markers, len(names))
+
+            # Size the pose pool for the most markers seen, so the thread does not
+            # have to reallocate slots
+            if max_markers > len(self._pose_pool[0][0]):
+                self._pose_pool = [(np.empty((max_markers, 3), dtype=np.float64),
+                                    np.empty((max_markers, 3, 3), dtype=np.float64))
+                                   for _ in range(MT_POSE_POOL_SIZE)]
+
+            # Touch every pose pool buffer so its pages are resident
+            for pos_out, rot_out in self._pose_pool:
+                pos_out.fill(0)
+                rot_out.fill(0)
+
+        self._stop_polling.clear()
+        self._poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._poll_thread.start()
+
+    def stop_polling(self) -> None:
+        """
+        Stops the background polling thread and waits for it to finish.
+        """
+        if self._poll_thread is None:
+            return
+
+        self._stop_polling.set()
+        self._poll_thread.join()
+        self._poll_thread = None
+
+    def snapshot(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Returns the latest poses published by the polling thread without blocking.
+
+        The arrays are views of a slot in the polling thread's pose pool, which is
+        rewritten once two newer frames have been published, so copy them if they
+        need to be kept.
+
+        Returns:
+            tuple: A tuple (names, positions, rotations) as returned by `get_poses_batch`,
+                or None if no frame has been processed since polling was last started or
+                the most recent frame failed.
+
+        Raises:
+            RuntimeError: If the polling thread stopped because of an exception.
+        """
+        # Reading the index is atomic, so no lock is needed
+        latest = self._latest_idx
+        if self._poll_error is not None:
+            raise RuntimeError("The polling thread stopped after an error") \
+                from self._poll_error
+        if latest < 0:
+            return None
+        return self._snapshots[latest]
+
+    def _check_not_polling(self) -> None:
+        """
+        Raises an error if the background polling thread is running.
+
+        Raises:
+            RuntimeError: If the background polling thread is running.
+        """
+        if self._poll_thread is not None and self._poll_thread.is_alive():
+            raise RuntimeError(
+                "Poses cannot be read directly while polling, use snapshot() instead")
+
+    def _poll_loop(self) -> None:
+        """
+        Grabs frames and publishes their poses into the pose pool, slot after slot,
+        until stopped. An exception ends the loop and is re-raised by `snapshot`.
+        """
+        write_idx = 0
+        backoff = 0.0
+        try:
+            while not self._stop_polling.is_set():
+                # On a failed frame, withdraw the last snapshot rather than report
+                # no markers, and back off instead of retrying in a tight loop
+                if not self._process_frame():
+                    self._latest_idx = -1
+                    backoff = min(max(2 * backoff, MT_POLL_MIN_BACKOFF), MT_POLL_MAX_BACKOFF)
+                    self._stop_polling.wait(backoff)
+                    continue
+                backoff = 0.0
+
+                # Get the number of markers identified in the current frame
+                num_markers = self._Collection_Count(self._markers)
+
+                # Fill the oldest slot, which readers are done with
+                pos_out, rot_out = self._pose_pool[write_idx]
+                if num_markers > len(pos_out):
+                    pos_out = np.empty((num_markers, 3), dtype=np.float64)
+                    rot_out = np.empty((num_markers, 3, 3), dtype=np.float64)
+                    self._pose_pool[write_idx] = (pos_out, rot_out)
+                names = self._read_poses(num_markers, pos_out, rot_out)
+
+                # Publish the filled slot, then move on to the next one
+                self._snapshots[write_idx] = (
+                    names, pos_out[:num_markers], rot_out[:num_markers])
+                self._latest_idx = write_idx
+                write_idx = (write_idx + 1) % MT_POSE_POOL_SIZE
+        except Exception as e:
+            # Withdraw the published poses so readers do not keep getting stale ones
+            self._latest_idx = -1
+            self._poll_error = e
+
+    def _read_poses(self,
+                    num_markers: int,
+                    pos_out: np.ndarray,
+                    rot_out: np.ndarray = None) -> List[str]:
+        """
+        Writes the poses of the markers identified in the current frame into the
+        leading rows of the given arrays.
+
+        Parameters:
+            num_markers (int): The number of markers identified in the current frame.
+            pos_out (np.ndarray): A C-contiguous array of shape (M, 3), M >= num_markers.
+            rot_out (np.ndarray): A C-contiguous array of shape (M, 3, 3), M >= num_markers,
+                or None to skip the rotation matrices.
+
+        Returns:
+            list: The names of the markers, in row order.
+
+        Raises:
+            ValueError: If an output array has the wrong layout or too few rows.
+        """
+        # The library writes raw doubles at the row addresses, so check the layout
+        _check_pose_output(pos_out, (3,), 'pos_out')
+        if rot_out is not None:
+            _check_pose_output(rot_out, (3, 3), 'rot_out')
+        for name, arr in (('pos_out', pos_out), ('rot_out', rot_out)):
+            if arr is not None and len(arr) < num_markers:
+                raise ValueError(
+                    f"{name} holds {len(arr)} rows but {num_markers} markers were detected")
+
+        # Bind the hot-loop callables and handles to locals once per frame
+        collection_int = self._Collection_Int
+        marker2camera_xf = self._Marker_Marker2CameraXfGet
+        shift_get = self._Xform3D_ShiftGet
+        rotmat_get = self._Xform3D_RotMatGet
+        get_marker_name = self._get_marker_name
+        markers_handle, camera, pose_xf = self._markers, self._camera, self._poseXf
+        camera_xf_p = self._camera_xf_p
+
+        # Row addresses are computed from the array bases and row strides
+        pos_base, pos_stride = pos_out.ctypes.data, pos_out.strides[0]
+        if rot_out is not None:
+            rot_base, rot_stride = rot_out.ctypes.data, rot_out.strides[0]
+        else:
+            rot_base = rot_stride = None
+
+        names = []
         for i in range(num_markers):
             # Get the handle of the current marker from the collection
-            marker = self.mtc_lib.Collection_Int(self._markers, i + 1)
+            marker = collection_int(markers_handle, i + 1)
 
             # Retrieve the pose of the marker
-            camera_xf = c_longlong()
-            self.mtc_lib.Marker_Marker2CameraXfGet(
-                marker, self._camera, self._poseXf, byref(camera_xf))
+            marker2camera_xf(marker, camera, pose_xf, camera_xf_p)
+            names.append(get_marker_name(marker))
+
+            # Let the library write straight into the rows of the outputs
+            shift_get(pose_xf, pos_base + i * pos_stride)
+            if rot_base is not None:
+                rotmat_get(pose_xf, rot_base + i * rot_stride)
+
+        return names
+
+    def _grow_pose_outputs(self, num_markers: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the reusable pose output buffers, growing them if they hold fewer
+        than the requested number of markers.
 
-            # Get the name of the marker
-            marker_name = self._get_marker_name(marker)
+        Parameters:
+            num_markers (int): The number of markers that must fit in the buffers.
+
+        Returns:
+            tuple: A tuple (positions, rotations) of shapes (M, 3) and (M, 3, 3), M >= num_markers.
+        """
+        if num_markers > len(self._pos_out):
+            self._pos_out = np.empty((num_markers, 3), dtype=np.float64)
+            self._rot_out = np.empty((num_markers, 3, 3), dtype=np.float64)
+        return self._pos_out, self._rot_out
+
+    def _bind_prototypes(self) -> None:
+        """
+        Sets the argument and return types of the library functions once
+        and binds them to instance attributes, so that each call only
+        performs the foreign function call.
+        """
+        lib = self.mtc_lib
 
-            # Retrieve the position of the marker
-            positions = (c_double * 3)()
-            self.mtc_lib.Xform3D_ShiftGet(self._poseXf, byref(positions))
-            np_positions = np.frombuffer(positions, dtype=np.float64)
+        # Error handling
+        lib.MTLastErrorString.restype = c_char_p
+        self._MTLastErrorString = lib.MTLastErrorString
 
-            # Optionally retrieve the rotation matrix of the marker
-            marker_data = {'pos': np.copy(np_positions)}
-            if rot:
-                rot_matrix = (c_double * 9)()
-                self.mtc_lib.Xform3D_RotMatGet(self._poseXf, byref(rot_matrix))
-                np_rot_matrix = np.frombuffer(
-                    rot_matrix, dtype=np.float64).reshape((3, 3))
-                marker_data['rot'] = np.copy(np_rot_matrix)
+        # Cameras
+        lib.Cameras_AttachAvailableCameras.argtypes = [c_char_p]
+        lib.Cameras_AttachAvailableCameras.restype = c_int
+        self._Cameras_AttachAvailableCameras = lib.Cameras_AttachAvailableCameras
 
-            # Store the retrieved data in the markers dict
-            markers[marker_name] = marker_data
+        lib.Cameras_Count.restype = c_int
+        self._Cameras_Count = lib.Cameras_Count
 
-        return markers
+        lib.Cameras_ItemGet.argtypes = [c_int, _P_LL]
+        lib.Cameras_ItemGet.restype = c_int
+        self._Cameras_ItemGet = lib.Cameras_ItemGet
+
+        lib.Cameras_StreamingModeSet.argtypes = [
+            POINTER(mtStreamingModeStruct), c_int]
+        lib.Cameras_StreamingModeSet.restype = c_int
+        self._Cameras_StreamingModeSet = lib.Cameras_StreamingModeSet
+
+        lib.Cameras_GrabFrame.argtypes = [c_longlong]
+        lib.Cameras_GrabFrame.restype = c_int
+        self._Cameras_GrabFrame = lib.Cameras_GrabFrame
+
+        lib.Camera_SerialNumberGet.argtypes = [c_longlong, _P_I]
+        lib.Camera_SerialNumberGet.restype = c_int
+        self._Camera_SerialNumberGet = lib.Camera_SerialNumberGet
+
+        lib.Camera_ResolutionGet.argtypes = [
+            c_longlong, _P_I, _P_I]
+        lib.Camera_ResolutionGet.restype = c_int
+        self._Camera_ResolutionGet = lib.Camera_ResolutionGet
+
+        # Markers
+        lib.Markers_LoadTemplates.argtypes = [c_char_p]
+        lib.Markers_LoadTemplates.restype = c_int
+        self._Markers_LoadTemplates = lib.Markers_LoadTemplates
+
+        lib.Markers_ProcessFrame.argtypes = [c_longlong]
+        lib.Markers_ProcessFrame.restype = c_int
+        self._Markers_ProcessFrame = lib.Markers_ProcessFrame
+
+        lib.Markers_IdentifiedMarkersGet.argtypes = [c_longlong, c_longlong]
+        lib.Markers_IdentifiedMarkersGet.restype = c_int
+        self._Markers_IdentifiedMarkersGet = lib.Markers_IdentifiedMarkersGet
+
+        lib.Marker_Marker2CameraXfGet.argtypes = [
+            c_longlong, c_longlong, c_longlong, _P_LL]
+        lib.Marker_Marker2CameraXfGet.restype = c_int
+        self._Marker_Marker2CameraXfGet = lib.Marker_Marker2CameraXfGet
+
+        lib.Marker_NameGet.argtypes = [
+            c_longlong, c_char_p, c_int, _P_I]
+        lib.Marker_NameGet.restype = c_int
+        self._Marker_NameGet = lib.Marker_NameGet
+
+        # Collections
+        lib.Collection_New.restype = c_longlong
+        self._Collection_New = lib.Collection_New
+
+        lib.Collection_Int.argtypes = [c_longlong, c_int]
+        lib.Collection_Int.restype = c_longlong
+        self._Collection_Int = lib.Collection_Int
+
+        lib.Collection_Count.argtypes = [c_longlong]
+        lib.Collection_Count.restype = c_int
+        self._Collection_Count = lib.Collection_Count
+
+        # 3D transformations
+        lib.Xform3D_New.restype = c_longlong
+        self._Xform3D_New = lib.Xform3D_New
+
+        # Outputs are passed as raw addresses of rows in C-contiguous float64 arrays
+        lib.Xform3D_ShiftGet.argtypes = [c_longlong, c_void_p]
+        lib.Xform3D_ShiftGet.restype = c_int
+        self._Xform3D_ShiftGet = lib.Xform3D_ShiftGet
+
+        lib.Xform3D_RotMatGet.argtypes = [c_longlong, c_void_p]
+        lib.Xform3D_RotMatGet.restype = c_int
+        self._Xform3D_RotMatGet = lib.Xform3D_RotMatGet
 
     def _process_error(self, function_name: str) -> None:
         """
@@ -263,7 +637,7 @@ class MTC(object):
         Parameters:
             function_name (str): The name of the function where the error occurred.
         """
-        error_message = self.mtc_lib.MTLastErrorString().decode('utf-8')
+        error_message = self._MTLastErrorString().decode('utf-8')
         warnings.warn(
             f"Error in {function_name}: {error_message}", RuntimeWarning)
 
@@ -271,16 +645,11 @@ class MTC(object):
         """
         Attaches available cameras using the calibration directory.
         """
-        # Set function argument and return types
-        self.mtc_lib.Cameras_AttachAvailableCameras.argtypes = [c_char_p]
-        self.mtc_lib.Cameras_AttachAvailableCameras.restype = c_int
-
         # Set the calibration directory path
-        calibration_dir = os.path.join(
-            self.mthome, 'CalibrationFiles').encode('utf-8')
+        calibration_dir = self._calib_dir.encode('utf-8')
 
         # Attach available cameras
-        result = self.mtc_lib.Cameras_AttachAvailableCameras(calibration_dir)
+        result = self._Cameras_AttachAvailableCameras(calibration_dir)
         if result != 0:
             self._process_error("Cameras_AttachAvailableCameras")
         else:
@@ -290,15 +659,11 @@ class MTC(object):
         """
         Loads marker templates from the specified directory.
         """
-        # Set function argument and return types
-        self.mtc_lib.Markers_LoadTemplates.argtypes = [c_char_p]
-        self.mtc_lib.Markers_LoadTemplates.restype = c_int
-
         # Set the marker templates directory path
-        marker_dir = os.path.join(self.mthome, 'Markers').encode('utf-8')
+        marker_dir = self._markers_dir.encode('utf-8')
 
         # Load the marker templates
-        result = self.mtc_lib.Markers_LoadTemplates(marker_dir)
+        result = self._Markers_LoadTemplates(marker_dir)
         if result != 0:
             self._process_error("Markers_LoadTemplates")
         else:
@@ -311,16 +676,12 @@ class MTC(object):
         Returns:
             int: The handle of the new collection as an integer, or None if creation failed.
         """
-        # Set the return type of Collection_New to c_longlong
-        self.mtc_lib.Collection_New.restype = c_longlong
-
-        if self.mtc_lib:
-            # Call the function and get the handle
-            collection_handle = self.mtc_lib.Collection_New()
-            if collection_handle:
-                return collection_handle
-            else:
-                self._process_error("Collection_New")
+        # Call the function and get the handle
+        collection_handle = self._Collection_New()
+        if collection_handle:
+            return collection_handle
+        else:
+            self._process_error("Collection_New")
         return None
 
     def _create_xform3d(self) -> int:
@@ -330,16 +691,12 @@ class MTC(object):
         Returns:
             int: The handle of the new 3D transformation object as an integer, or None if creation failed.
         """
-        # Set the return type of Xform3D_New to c_longlong
-        self.mtc_lib.Xform3D_New.restype = c_longlong
-
-        if self.mtc_lib:
-            # Call the function and get the handle
-            xform3d_handle = self.mtc_lib.Xform3D_New()
-            if xform3d_handle:
-                return xform3d_handle
-            else:
-                self._process_error("Xform3D_New")
+        # Call the function and get the handle
+        xform3d_handle = self._Xform3D_New()
+        if xform3d_handle:
+            return xform3d_handle
+        else:
+            self._process_error("Xform3D_New")
         return None
 
     def _get_frame_markers(self) -> int:
@@ -348,49 +705,48 @@ class MTC(object):
         and returns the number of markers identified.
 
         Returns:
-            int: The number of markers identified in the current frame.
+            int: The number of markers identified in the current frame, or 0 if the
+                frame could not be grabbed or processed.
         """
-        # Define the argument types for the required functions
-        self.mtc_lib.Cameras_GrabFrame.argtypes = [c_longlong]
-        self.mtc_lib.Cameras_GrabFrame.restype = c_int
+        if not self._process_frame():
+            return 0
 
-        self.mtc_lib.Markers_ProcessFrame.argtypes = [c_longlong]
-        self.mtc_lib.Markers_ProcessFrame.restype = c_int
+        # Count the number of markers in the collection
+        num_markers = self._Collection_Count(self._markers)
 
-        self.mtc_lib.Markers_IdentifiedMarkersGet.argtypes = [
-            c_longlong, c_longlong]
-        self.mtc_lib.Markers_IdentifiedMarkersGet.restype = c_int
+        return num_markers
 
-        self.mtc_lib.Collection_Count.argtypes = [c_longlong]
-        self.mtc_lib.Collection_Count.restype = c_int
+    def _process_frame(self) -> bool:
+        """
+        Grabs a frame from the camera and collects the markers identified in it.
 
+        Returns:
+            bool: True if the frame was grabbed and processed, False on error.
+        """
         # Grab a frame from the camera
-        result = self.mtc_lib.Cameras_GrabFrame(self._camera)
+        result = self._Cameras_GrabFrame(self._camera)
         if result != 0:  # Check for success, assuming 0 indicates success
             self._process_error("Cameras_GrabFrame")
-            return 0
+            return False
 
         # Process the frame to identify markers
-        result = self.mtc_lib.Markers_ProcessFrame(self._camera)
+        result = self._Markers_ProcessFrame(self._camera)
         if result != 0:
             self._process_error("Markers_ProcessFrame")
-            return 0
+            return False
 
         # Get the identified markers from the processed frame
-        result = self.mtc_lib.Markers_IdentifiedMarkersGet(
+        result = self._Markers_IdentifiedMarkersGet(
             self._camera, self._markers)
         if result != 0:
             self._process_error("Markers_IdentifiedMarkersGet")
-            return 0
+            return False
 
-        # Count the number of markers in the collection
-        num_markers = self.mtc_lib.Collection_Count(self._markers)
-
-        return num_markers
+        return True
 
     def _get_marker_name(self, marker_handle: int) -> str:
         """
-        Retrieves the name of the specified marker.
+        Retrieves the name of the specified marker, cached by marker handle.
 
         Parameters:
             marker_handle (int): The handle of the marker.
@@ -398,22 +754,19 @@ class MTC(object):
         Returns:
             str: The name of the marker as a string, or None if the operation failed.
         """
-        # Set function argument and return types
-        self.mtc_lib.Marker_NameGet.argtypes = [
-            c_longlong, c_char_p, c_int, POINTER(c_int)]
-        self.mtc_lib.Marker_NameGet.restype = c_int
-
-        if self.mtc_lib:
-            name_buffer = create_string_buffer(
-                MT_MAX_STRING_LENGTH)  # Create a buffer for the name
-            actual_chars = c_int()  # Variable to hold the actual number of characters written
-
-            # Call the function to get the marker name
-            result = self.mtc_lib.Marker_NameGet(
-                marker_handle, name_buffer, MT_MAX_STRING_LENGTH, byref(actual_chars))
-            if result == 0:
-                # Convert the buffer to a Python string, limited to the actual number of characters
-                return name_buffer.value.decode('utf-8')[:actual_chars.value]
-            else:
-                self._process_error("Marker_NameGet")
+        # Return the cached name if this marker was seen before
+        name = self._name_cache.get(marker_handle)
+        if name is not None:
+            return name
+
+        # Call the function to get the marker name into the shared buffer
+        result = self._Marker_NameGet(
+            marker_handle, self._name_buf, MT_MAX_STRING_LENGTH, byref(self._name_chars))
+        if result == 0:
+            # Convert the buffer to a Python string, limited to the actual number of characters
+            name = self._name_buf.value.decode('utf-8')[:self._name_chars.value]
+            self._name_cache[marker_handle] = name
+            return name
+        else:
+            self._process_error("Marker_NameGet")
         return None
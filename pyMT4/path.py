@@ -1,26 +1,87 @@
+import os
 import winreg
 import warnings
+import functools
 
-# Attempt to read the MTHome path from the registry
-try:
-    # Open the registry key where MTHome is expected
-    key = winreg.OpenKey(
-        winreg.HKEY_LOCAL_MACHINE,
-        r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
-    )
-
-    # Query the value for 'MTHome'
-    MTHome, regtype = winreg.QueryValueEx(key, "MTHome")
-
-    # Close the registry key
-    winreg.CloseKey(key)
-
-except FileNotFoundError:
-    # Warn if MTHome is not found in the registry
-    warnings.warn("MTHome not found in the registry.", RuntimeWarning)
-    MTHome = None
-
-except OSError as e:
-    # Warn if there's an error accessing the registry
-    warnings.warn(f"Error accessing the registry: {e}", RuntimeWarning)
-    MTHome = None
\ No newline at end of file
+
+@functools.lru_cache(maxsize=1)
+def mt_home() -> str:
+    """
+    Reads the MTHome path from the registry, once per process.
+
+    Returns:
+        str: The path to the MTHome directory, or None if it could not be read.
+    """
+    try:
+        # Open the registry key where MTHome is expected
+        key = winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE,
+            r"SYSTEM\CurrentControlSet\Control\Session Manager\Environment"
+        )
+
+        # Query the value for 'MTHome'
+        home, regtype = winreg.QueryValueEx(key, "MTHome")
+
+        # Close the registry key
+        winreg.CloseKey(key)
+        return home
+
+    except FileNotFoundError:
+        # Warn if MTHome is not found in the registry
+        warnings.warn("MTHome not found in the registry.", RuntimeWarning)
+
+    except OSError as e:
+        # Warn if there's an error accessing the registry
+        warnings.warn(f"Error accessing the registry: {e}", RuntimeWarning)
+
+    return None
+
+
+def lib_path(home: str) -> str:
+    """
+    Returns the path to the MTC shared library under an MTHome directory.
+
+    Parameters:
+        home (str): The path to the MTHome directory.
+
+    Returns:
+        str: The path to the MTC shared library.
+    """
+    return os.path.join(home, 'Dist64MT4', 'mtc.dll')
+
+
+def calib_dir(home: str) -> str:
+    """
+    Returns the path to the calibration directory under an MTHome directory.
+
+    Parameters:
+        home (str): The path to the MTHome directory.
+
+    Returns:
+        str: The path to the calibration directory.
+    """
+    return os.path.join(home, 'CalibrationFiles')
+
+
+def markers_dir(home: str) -> str:
+    """
+    Returns the path to the marker templates directory under an MTHome directory.
+
+    Parameters:
+        home (str): The path to the MTHome directory.
+
+    Returns:
+        str: The path to the marker templates directory.
+    """
+    return os.path.join(home, 'Markers')
+
+
+# Default MTHome directory layout, computed once at import
+MTHome = mt_home()
+
+if MTHome is not None:
+    LIB_PATH = lib_path(MTHome)
+    CALIB_DIR = calib_dir(MTHome)
+    MARKERS_DIR = markers_dir(MTHome)
+else:
+    LIB_PATH = CALIB_DIR = MARKERS_DIR = None